@@ -1,16 +1,18 @@
 # Copyright (c) 2024 IOTA Stiftung
 # SPDX-License-Identifier: Apache-2.0
-import os, re, argparse, subprocess
+import io, os, re, argparse, subprocess
 
 COMMENT_DEPENDENCIES_START_EXTERNAL = "# external dependencies"
 COMMENT_DEPENDENCIES_START_INTERNAL = "# internal dependencies"
 
+SECTION_REGEX = re.compile(r'^\[([a-zA-Z0-9_-]+)\]$')
+PACKAGE_SECTION_REGEX = re.compile(r'^\[package\]$')
+PACKAGE_NAME_REGEX = re.compile(r'^name\s*=\s*"(.*)"$')
+ARRAY_START_REGEX = re.compile(r'^([a-zA-Z0-9_-]+)\s*=\s*\[$')
+CRATES_LINE_REGEX = re.compile(r'^([a-zA-Z0-9_-]+)(?:\.workspace)?\s*=\s*(?:{[^}]*\bpackage\s*=\s*"(.*?)"[^}]*}|.*)$')
+
 def get_package_name_from_cargo_toml(file_path):
     # search for the [package] section in the Cargo.toml file
-    section_regex = re.compile(r'^\[([a-zA-Z0-9_-]+)\]$')
-    package_section_regex = re.compile(r'^\[package\]$')
-    package_name_regex = re.compile(r'^name\s*=\s*"(.*)"$')
-
     with open(file_path, 'r') as file:
         lines = file.readlines()
     
@@ -18,16 +20,16 @@ def get_package_name_from_cargo_toml(file_path):
     for line in lines:
         stripped_line = line.strip()
 
-        if not in_package_section and package_section_regex.match(stripped_line):
+        if not in_package_section and PACKAGE_SECTION_REGEX.match(stripped_line):
             in_package_section = True
             continue
 
         if in_package_section:
-            package_name_match = package_name_regex.match(stripped_line)
+            package_name_match = PACKAGE_NAME_REGEX.match(stripped_line)
             if package_name_match:
                 return package_name_match.group(1)
             
-            if section_regex.match(stripped_line):
+            if SECTION_REGEX.match(stripped_line):
                 # we are done with the package section
                 return None
     
@@ -51,11 +53,11 @@ def get_package_names_from_cargo_tomls(directory):
     return package_names
 
 def process_cargo_toml(file_path, internal_crates_dict, debug):
-    with open(file_path, 'r') as file:
-        lines = file.readlines()
-
-    array_start_regex = re.compile(r'^([a-zA-Z0-9_-]+)\s*=\s*\[$')
-    crates_line_regex = re.compile(r'^([a-zA-Z0-9_-]+)(?:\.workspace)?\s*=\s*(?:{[^}]*\bpackage\s*=\s*"(.*?)"[^}]*}|.*)$')
+    # read the raw content without newline translation, so we only skip
+    # rewriting files whose content really is unchanged
+    with open(file_path, 'r', newline='') as file:
+        content = file.read()
+    lines = io.StringIO(content, newline=None).readlines()
 
     class Section(object):
         def __init__(self, line):
@@ -236,7 +238,7 @@ def process_cargo_toml(file_path, internal_crates_dict, debug):
             continue
 
         # check if the line is an array start
-        array_start_regex_search = array_start_regex.search(stripped_line)
+        array_start_regex_search = ARRAY_START_REGEX.search(stripped_line)
         if array_start_regex_search:
             print_debug_info(f"   -> Array start: {array_start_regex_search.group(1)}")
             
@@ -276,7 +278,7 @@ def process_cargo_toml(file_path, internal_crates_dict, debug):
             continue
 
         # check if the line is a crate line
-        crate_regex_search  = crates_line_regex.search(stripped_line)
+        crate_regex_search  = CRATES_LINE_REGEX.search(stripped_line)
         if crate_regex_search:
             print_debug_info(f"   -> Crate: {crate_regex_search.group(1)}")
             
@@ -299,12 +301,17 @@ def process_cargo_toml(file_path, internal_crates_dict, debug):
 
     finish_section()
 
+    # add a newline for every entry in the processed lines list except the last one,
+    # it is a newline anyway (added by finish_section)
+    new_lines = [f"{line}\n" for line in processed_lines[:-1]]
+
+    # don't touch the file if it is already sorted
+    if "".join(new_lines) == content:
+        return
+
     # Rewrite the file with the processed lines
     with open(file_path, 'w') as file:
-        # write a newline for every entry in the processed lines list except the last one,
-        # it is a newline anyway (added by finish_section)
-        for line in processed_lines[:-1]:
-            file.write(f"{line}\n")
+        file.writelines(new_lines)
 
 def find_and_process_toml_files(directory, internal_crates_dict, ignored_folders, debug):
     print("Processing Cargo.toml files...")
@@ -327,14 +334,8 @@ def find_and_process_toml_files(directory, internal_crates_dict, ignored_folders
 
 # Run dprint fmt
 def run_dprint_fmt(directory):
-    cwd = os.getcwd()
-
     print("Running dprint fmt...")
-    try:
-        os.chdir(directory)
-        subprocess.run(["dprint", "fmt"], check=True)
-    finally:
-        os.chdir(cwd)
+    subprocess.run(["dprint", "fmt"], cwd=directory, check=True)
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Format the Cargo.toml files and sort internal and external dependencies.')
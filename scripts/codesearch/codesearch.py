@@ -1,6 +1,6 @@
 # Copyright (c) 2024 IOTA Stiftung
 # SPDX-License-Identifier: Apache-2.0
-import os, re
+import os, re, subprocess
 from tqdm import tqdm
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
@@ -13,15 +13,9 @@ def get_crate_name(crate_path):
     if crate_path in crate_name_cache:
         return crate_name_cache[crate_path]
     
-    # get the current working directory
-    cwd = os.getcwd()
-
     try:
-        # change the current working directory
-        os.chdir(crate_path)
-
-        # get the output of the command "cargo read-manifest"
-        cargo_manifest = os.popen("cargo read-manifest").read()
+        # get the output of the command "cargo read-manifest" in the crate directory
+        cargo_manifest = subprocess.run(["cargo", "read-manifest"], cwd=crate_path, stdout=subprocess.PIPE, text=True).stdout
 
         # parse the "name" field from the json output
         component_name = re.search(r'"name":\s*"([^"]+)"', cargo_manifest).group(1)
@@ -34,9 +28,6 @@ def get_crate_name(crate_path):
         # cache the crate name as "Unknown"
         crate_name_cache[crate_path] = "Unknown"
         return "Unknown"
-    finally:
-        # change back to the original working directory
-        os.chdir(cwd)
 
 # Searches for given files that match the pattern and are not in the ignored directories, 
 # and calls the search_in_file_func for each file to search for the pattern in parallel.
@@ -44,8 +35,9 @@ def search_files_in_parallel(target_dir, ignored_dirs, file_pattern, search_in_f
     all_files = []
 
     # Collect all files that match the pattern
-    for root, _, files in os.walk(target_dir):
+    for root, dirs, files in os.walk(target_dir):
         if any(ignored_dir in root for ignored_dir in ignored_dirs):
+            dirs.clear()    # Don't walk into the directory if it should be ignored
             continue
         for file in files:
             if file_pattern.search(file):
@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import re
+import shutil
 import argparse
+import tempfile
 
 # Regular expression to match the entire pattern in one go
 pattern = re.compile(
     r"diesel::allow_tables_to_appear_in_same_query!\(\n"
-    r"(.*)"  # Captures table names
-    r"\);\n",
-    re.DOTALL
+    r"([\s\S]*?)"  # Captures table names up to the first closing ");"
+    r"\);\n"
 )
 
 # Function to format the replacement text
@@ -37,11 +39,27 @@ if __name__ == "__main__":
     with open(filename, "r") as file:
         content = file.read()
 
-    # Perform the replacement
-    new_content = pattern.sub(replace_match, content)
+    # Perform the replacement, there is only a single macro invocation in the file
+    new_content, count = pattern.subn(replace_match, content, count=1)
+    if count == 0:
+        print(f"Pattern not found in '{filename}', nothing to do.")
+        sys.exit(0)
 
-    # Write the modified content back to the file
-    with open(filename, "w") as file:
-        file.write(new_content)
+    # Write the modified content to a temporary file next to the original and
+    # swap it in atomically, so an interrupted run never leaves a half-written file
+    fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)))
+    try:
+        try:
+            file = os.fdopen(fd, "w")
+        except BaseException:
+            os.close(fd)
+            raise
+        with file:
+            file.write(new_content)
+        shutil.copymode(filename, tmp_filename)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        os.unlink(tmp_filename)
+        raise
 
     print(f"Pattern replaced successfully in '{filename}'.")
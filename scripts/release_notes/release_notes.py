@@ -136,7 +136,7 @@ def extract_notes_from_rebase_commit(commit):
         return pr_number, pr_notes
 
 
-def extract_notes(commit, seen):
+def extract_notes(commit, seen, message=None):
     """Get release notes from a commit message.
 
     Find the 'Release notes' section in the commit message, and
@@ -147,8 +147,12 @@ def extract_notes(commit, seen):
     areas mapped to their release note. Each release note indicates
     whether it has a note and whether it was checked (ticked).
 
+    The commit message is read from git unless it is passed in as
+    `message`.
+
     """
-    message = git("show", "-s", "--format=%B", commit)
+    if message is None:
+        message = git("show", "-s", "--format=%B", commit)
 
     # Extract PR number from squashed commits
     match = RE_PR.match(message)
@@ -276,20 +280,24 @@ def do_generate(from_, to):
 
     protocol_version = extract_protocol_version(to) or "XX"
 
+    # Fetch the hashes and messages of all commits with a single git
+    # invocation, records are NUL separated and start with the hash line.
     commits = git(
         "log",
-        "--pretty=format:%H",
+        "-z",
+        "--pretty=format:%H%n%B",
         f"{from_}..{to}",
         "--",
         *INTERESTING_DIRECTORIES,
-    ).strip()
+    ).strip("\0")
 
     if not commits:
         return
 
     seen_prs = set()
-    for commit in commits.split("\n"):
-        pr, notes = extract_notes(commit, seen_prs)
+    for record in commits.split("\0"):
+        commit, _, message = record.partition("\n")
+        pr, notes = extract_notes(commit, seen_prs, message.strip())
         seen_prs.add(pr)
         for impacted, note in notes:
             if note.checked:
@@ -5,9 +5,12 @@
 
 import os
 import re
+import sys
 import argparse
 import difflib
 
+IGNORED_FOLDERS = {'.git', 'target', 'node_modules'}
+
 def replace_protocol_version_in_file(file_path, old_version, new_version, yes_to_all, dry_run):
     with open(file_path, 'r') as file:
         content = file.readlines()
@@ -30,7 +33,8 @@ def replace_protocol_version_in_file(file_path, old_version, new_version, yes_to
             fromfile='original',
             tofile='updated'
         )
-        print(''.join(diff))
+        sys.stdout.writelines(diff)
+        print()
 
         if dry_run:
             return
@@ -49,6 +53,9 @@ def replace_protocol_version_in_file(file_path, old_version, new_version, yes_to
 
 def replace_protocol_version_in_repo(repo_path, old_version, new_version, yes_to_all, dry_run):
     for root, dirs, files in os.walk(repo_path):
+        # Don't walk into build artifacts and other folders that never contain the tests
+        dirs[:] = [d for d in dirs if d not in IGNORED_FOLDERS]
+
         for file in files:
             if "iota-graphql-e2e-tests" in root.split(os.sep):
                 if file.endswith('.move'):